@@ -5,7 +5,7 @@ well as to im- and export them.
 
 import json
 import urllib.request
-from typing import List, Union
+from typing import List, Optional, Union
 
 from libcobblersignatures.enums import ExportTypes, ImportTypes
 from libcobblersignatures.models.osbreed import OsBreed
@@ -24,6 +24,10 @@ class Signatures:
     _rootkey: str
     _signaturesjson: dict
     _osbreeds: List[OsBreed]
+    _breed_names_cache: Optional[List[str]]
+    _breed_indices_cache: Optional[dict]
+    _breeds_by_name_cache: Optional[dict]
+    _export_cache: Optional[dict]
 
     def __init__(self):
         """
@@ -33,6 +37,27 @@ class Signatures:
         self._rootkey = "breeds"
         self._signaturesjson = {}
         self._osbreeds = []
+        self._breed_names_cache = None
+        self._breed_indices_cache = None
+        self._breeds_by_name_cache = None
+        self._export_cache = None
+
+    def _invalidate_caches(self):
+        """
+        Drop all caches which are derived from the list of breeds. Called by every method which mutates the breeds.
+        """
+        self._breed_names_cache = None
+        self._breed_indices_cache = None
+        self._breeds_by_name_cache = None
+        self._export_cache = None
+
+    def mark_dirty(self):
+        """
+        Tell this instance that the models were mutated without going through one of its methods, for example by
+        assigning to an attribute of an :class:`Osversion` directly. This drops the cached export output so the next
+        export walks the model tree again.
+        """
+        self._invalidate_caches()
 
     @property
     def signaturesjson(self) -> dict:
@@ -72,6 +97,19 @@ class Signatures:
         :param value: The list with the OsBreeds.
         """
         self._osbreeds = value
+        self._invalidate_caches()
+
+    @property
+    def breed_names(self) -> List[str]:
+        """
+        The names of all currently loaded operating system breeds. The list is cached and only rebuilt after the
+        breeds were mutated, which keeps repeated menu redraws in the CLI cheap.
+
+        :return: A copy of the list with the breed names, in the order of ``osbreeds``.
+        """
+        if self._breed_names_cache is None:
+            self._breed_names_cache = [breed.name for breed in self._osbreeds]
+        return list(self._breed_names_cache)
 
     def importsignatures(self, import_type: ImportTypes, source: str):
         """
@@ -90,6 +128,17 @@ class Signatures:
         else:
             raise ValueError("Please use on of the four given options for the source!")
 
+    def import_and_build(self, import_type: ImportTypes, source: str):
+        """
+        Import the signatures from a source and directly build the models from it. This is the one-stop variant of
+        calling ``importsignatures()`` followed by ``jsontomodels()``; the parsed JSON is walked only once.
+
+        :param import_type: This is one of the four options from the ImportTypes Enum
+        :param source: A string containing the data to be parsed into a json in the end
+        """
+        self.importsignatures(import_type, source)
+        self.jsontomodels()
+
     def _importsignaturesfile(self, filepath: str):
         """
         Internal function to handle the import of a file based import.
@@ -110,6 +159,22 @@ class Signatures:
         data = response.read()
         self.signaturesjson = data.decode("utf-8")
 
+    def _to_plain(self) -> dict:
+        """
+        Convert the internal data to a plain dictionary which can be handed to the json module. The result is cached
+        until the models are mutated, so the common "import, then export" flow only walks the model tree once. Only
+        for internal usage.
+
+        :return: The dictionary with the encoded breeds below the root key.
+        """
+        if self._export_cache is None:
+            self._export_cache = {
+                self._rootkey: {
+                    breed.name: breed.encode() for breed in self.osbreeds
+                }
+            }
+        return self._export_cache
+
     def __prepare_export_output(
         self, sort_keys: bool = False, indent: Union[None, int] = None
     ) -> str:
@@ -119,8 +184,18 @@ class Signatures:
         :param sort_keys: If the keys of the dictionary should be sorted to be more human readable.
         :param indent: If this is something other then ``None`` then the JSON will be pretty printed.
         """
-        value = {breed.name: breed.encode() for breed in self.osbreeds}
-        return json.dumps({self._rootkey: value}, sort_keys=sort_keys, indent=indent)
+        return json.dumps(self._to_plain(), sort_keys=sort_keys, indent=indent)
+
+    def dump_json(self, fp, sort_keys: bool = False, indent: Union[None, int] = None):
+        """
+        Serialize the current models as JSON directly into a file object. In contrast to ``exportsignatures()`` with
+        :class:`ExportTypes.STRING` this streams the output and never materializes the whole document in memory.
+
+        :param fp: A ``.write()`` supporting file-like object.
+        :param sort_keys: If the keys of the dictionary should be sorted to be more human readable.
+        :param indent: If this is something other then ``None`` then the JSON will be pretty printed.
+        """
+        json.dump(self._to_plain(), fp, sort_keys=sort_keys, indent=indent)
 
     def exportsignatures(
         self,
@@ -152,7 +227,7 @@ class Signatures:
                     "Please provide a path if your want to export to a file!"
                 )
             with open(target, "w") as f:
-                f.write(self.__prepare_export_output(sort_keys, indent))
+                self.dump_json(f, sort_keys, indent)
         elif export_type == ExportTypes.STRING:
             return self.__prepare_export_output(sort_keys, indent)
         else:
@@ -172,7 +247,8 @@ class Signatures:
         for key in breeds:
             breed = OsBreed(key)
             breed.decode(breeds[key])
-            self.osbreeds.append(breed)
+            self._osbreeds.append(breed)
+        self._invalidate_caches()
 
     def addosbreed(self, name: str):
         """
@@ -180,9 +256,10 @@ class Signatures:
 
         :param name: The name of the new breed. Must not exist in the currently loaded models.
         """
-        if name in [x.name for x in self.osbreeds]:
+        if self.get_breed_by_name(name) is not None:
             raise ValueError('Breed "%s" already in the list of breeds!' % name)
-        self.osbreeds.append(OsBreed(name))
+        self._osbreeds.append(OsBreed(name))
+        self._invalidate_caches()
 
     def addosversion(self, breedindex: int, versionname: str, versiondata):
         """
@@ -197,6 +274,7 @@ class Signatures:
         if versiondata is None:
             versiondata = Osversion()
         self.osbreeds[breedindex].osversion_add(versionname, versiondata)
+        self._invalidate_caches()
 
     def removeosbreed(self, index: int):
         """
@@ -206,7 +284,20 @@ class Signatures:
         """
         if index >= len(self.osbreeds):
             raise ValueError("Index out of Range")
-        del self.osbreeds[index]
+        del self._osbreeds[index]
+        self._invalidate_caches()
+
+    def renameosbreed(self, index: int, name: str):
+        """
+        Rename an operating system breed via its index.
+
+        :param index: The index of the breed to rename.
+        :param name: The new name of the breed.
+        """
+        if index >= len(self.osbreeds):
+            raise ValueError("Index out of Range")
+        self._osbreeds[index].name = name
+        self._invalidate_caches()
 
     def removeosversion(self, breedindex: int, versionname: str):
         """
@@ -216,6 +307,7 @@ class Signatures:
         :param versionname: The name of the version to remove.
         """
         self.osbreeds[breedindex].osversion_remove(versionname)
+        self._invalidate_caches()
 
     def get_breed_index_by_name(self, name: str) -> int:
         """
@@ -224,9 +316,21 @@ class Signatures:
         :param name: The name of the :class:`OsBreed` to look for.
         :return: The number of the index or ``-1``.
         """
-        list_length = len(self.osbreeds)
-        if list_length > 0:
-            for index in range(list_length):
-                if name == self.osbreeds[index].name:
-                    return index
-        return -1
+        if self._breed_indices_cache is None:
+            self._breed_indices_cache = {
+                breed.name: index for index, breed in enumerate(self._osbreeds)
+            }
+        return self._breed_indices_cache.get(name, -1)
+
+    def get_breed_by_name(self, name: str) -> Optional[OsBreed]:
+        """
+        Searches with the name of the :class:`OsBreed` for the breed itself.
+
+        :param name: The name of the :class:`OsBreed` to look for.
+        :return: The breed or ``None`` in case no breed carries the name.
+        """
+        if self._breeds_by_name_cache is None:
+            self._breeds_by_name_cache = {
+                breed.name: breed for breed in self._osbreeds
+            }
+        return self._breeds_by_name_cache.get(name)
@@ -4,338 +4,316 @@ This module contains no logic related to the library, it just contains logic for
 managed by it.
 """
 
-import questionary
+import sys
+from functools import lru_cache
 
 from libcobblersignatures import Signatures
 from libcobblersignatures.enums import ImportTypes, ExportTypes
 
-os_signatures = Signatures()
+_os_signatures = None
 
-# questions
 
-main_menu_questions = questionary.select(
-    "What do you want to do?", choices=["Import", "Export", "Edit", "Exit"]
-)
+def _signatures() -> Signatures:
+    """
+    Return the module wide :class:`Signatures` instance and build it on first use. Keeping the construction out of
+    import time means invocations which never touch the models, for example ``--help``, do not pay for it.
 
-import_menu_questions = questionary.select(
-    "What is your desired source of input?",
-    choices=["URL", "String", "File", "Go back"],
-)
+    :return: The shared Signatures instance.
+    """
+    global _os_signatures
+    if _os_signatures is None:
+        _os_signatures = Signatures()
+    return _os_signatures
 
-import_menu_questions2 = questionary.path(
-    "Please enter the json in a single line or the source in a single line:"
-)
 
+def __getattr__(name: str):
+    # PEP 562: keep the documented ``os_signatures`` module attribute working without building it at import.
+    if name == "os_signatures":
+        return _signatures()
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
 
-class IntegerValidator(questionary.Validator):
+
+@lru_cache(maxsize=1)
+def _get_questionary():
     """
-    Validator class which checks if the input is an integer.
+    Import questionary on first use. The import pulls in prompt_toolkit which is expensive and only needed once an
+    interactive prompt is actually shown.
+
+    :return: The questionary module.
     """
+    import questionary
+
+    return questionary
+
+
+# questions
 
-    def validate(self, document):
-        """
-        Validation function which does raise a ValidationError or does not return a value.
 
-        :param document: The user input. Handed over by questionary.
-        :raises ValidationError: In case the text could not be parsed to an integer.
+@lru_cache(maxsize=1)
+def _integer_validator():
+    """
+    Build the validator class which checks if the input is an integer. Deferred because the base class lives in
+    questionary.
+
+    :return: The validator class.
+    """
+    questionary = _get_questionary()
+
+    class IntegerValidator(questionary.Validator):
         """
-        if len(document.text) == 0:
-            return
-        try:
-            int(document.text)
-        except ValueError:
-            raise questionary.ValidationError(message="Please enter an integer!")
-
-
-export_menu_questions = [
-    {
-        "type": "select",
-        "name": "export_menu_target",
-        "message": "What is your desired export target?",
-        "choices": ["String", "File", "Go back"],
-    },
-    {
-        "type": "confirm",
-        "name": "export_menu_prettyprint_1",
-        "message": "Should the keys be sorted?",
-        "when": lambda x: x["export_menu_target"] != "Go back",
-    },
-    {
-        "type": "text",
-        "name": "export_menu_prettyprint_2",
-        "message": "Which indentation should the keys have? (Hit enter for no indentation or enter a number)",
-        #'default': None,
-        "validate": IntegerValidator,
-        "when": lambda x: x["export_menu_target"] != "Go back",
-    },
-]
-
-export_menu_questions2 = questionary.text("Please enter the target path")
-
-edit_menu_questions = questionary.select(
-    "What do you want to do?",
-    choices=[
-        "Add Operating System Breed",
-        "Remove Operating System Breed",
-        "Edit the name of an Operating System Breed",
-        "Add Operating System Version",
-        "Remove Operating System Version",
-        "Edit the information of an Operating System Version",
-        "Start from scratch",
-        "Go back",
-    ],
-)
-
-edit_add_os_breed = questionary.text(
-    "What should the name of the new Operating System Breed be?"
-)
-
-edit_remove_os_breed = [
-    {
-        "type": "select",
-        "name": "edit_remove_os_breed",
-        "message": "What Operating System Breed (and all its versions) do you want to remove?",
-        "choices": [""],
-    }
-]
-
-edit_name_os_breed_1 = [
-    {
-        "type": "select",
-        "name": "edit_name_os_breed_1",
-        "message": "Which Operating System Breed do you want to edit?",
-        "choices": [""],
-    }
-]
-
-edit_name_os_breed_2 = questionary.text("What shall be the new name?")
-
-edit_add_os_version_1 = [
-    {
-        "type": "select",
-        "name": "edit_add_os_version_1",
-        "message": "Under what Operating System Breed shall the new Version be put?",
-        "choices": [""],
-    }
-]
-
-edit_add_os_version_2 = [
-    {
-        "type": "text",
-        "name": "edit_add_os_version_2",
-        "message": "What shall be the name of the new version?",
-    }
-]
-
-edit_remove_os_version_1 = [
-    {
-        "type": "select",
-        "name": "edit_remove_os_version_1",
-        "message": "In what Operating System Breed is the to be removed OS Version?",
-        "choices": [""],
-    }
-]
-
-edit_remove_os_version_2 = [
-    {
-        "type": "select",
-        "name": "edit_remove_os_version_2",
-        "message": "What is the version that you wish to remove?",
-        "choices": [""],
-    }
-]
-
-edit_information_os_version_which = [
-    {
-        "type": "select",
-        "name": "edit_information_os_version_which",
-        "message": "In which operating system breed should the version be?",
-        "choices": [""],
-    }
-]
-
-edit_information_os_version_which_2 = [
-    {
-        "type": "select",
-        "name": "edit_information_os_version_which_2",
-        "message": "Which operating system version details do you want to edit?",
-        "choices": [""],
-    }
-]
-
-edit_information_os_version = [
-    {
-        "type": "select",
-        "name": "edit_information_os_version",
-        "message": "What key of the Signatures do you want to edit?",
-        "choices": [
-            "signatures",
-            "version_file",
-            "version_file_regex",
-            "kernel_arch",
-            "kernel_arch_regex",
-            "supported_arches",
-            "supported_repo_breeds",
-            "kernel_file",
-            "initrd_file",
-            "isolinux_ok",
-            "default_autoinstall",
-            "kernel_options",
-            "kernel_options_post",
-            "boot_files",
+        Validator class which checks if the input is an integer.
+        """
+
+        def validate(self, document):
+            """
+            Validation function which does raise a ValidationError or does not return a value.
+
+            :param document: The user input. Handed over by questionary.
+            :raises ValidationError: In case the text could not be parsed to an integer.
+            """
+            if len(document.text) == 0:
+                return
+            try:
+                int(document.text)
+            except ValueError:
+                raise questionary.ValidationError(message="Please enter an integer!")
+
+    return IntegerValidator
+
+
+def _select(message: str, choices: list):
+    """
+    Factory for a questionary select question.
+
+    :param message: The message which is shown to the user.
+    :param choices: The choices the user can pick from.
+    :return: A callable building the question.
+    """
+    return lambda: _get_questionary().select(message, choices=list(choices))
+
+
+def _text(message: str):
+    """
+    Factory for a questionary text question.
+
+    :param message: The message which is shown to the user.
+    :return: A callable building the question.
+    """
+    return lambda: _get_questionary().text(message)
+
+
+def _export_menu_questions() -> list:
+    """
+    Build the questions for the export menu. This is a separate factory since the indentation question needs the
+    lazily built integer validator.
+
+    :return: The list with the question dictionaries.
+    """
+    return [
+        {
+            "type": "select",
+            "name": "export_menu_target",
+            "message": "What is your desired export target?",
+            "choices": ["String", "File", "Go back"],
+        },
+        {
+            "type": "confirm",
+            "name": "export_menu_prettyprint_1",
+            "message": "Should the keys be sorted?",
+            "when": lambda x: x["export_menu_target"] != "Go back",
+        },
+        {
+            "type": "text",
+            "name": "export_menu_prettyprint_2",
+            "message": "Which indentation should the keys have? (Hit enter for no indentation or enter a number)",
+            #'default': None,
+            "validate": _integer_validator(),
+            "when": lambda x: x["export_menu_target"] != "Go back",
+        },
+    ]
+
+
+def _single_select_question(name: str, message: str):
+    """
+    Factory for a dictionary style question with a single select whose choices are filled in later via
+    ``update_choices``.
+
+    :param name: The name under which the answer is returned.
+    :param message: The message which is shown to the user.
+    :return: A callable building the question.
+    """
+    return lambda: [
+        {
+            "type": "select",
+            "name": name,
+            "message": message,
+            "choices": [""],
+        }
+    ]
+
+
+# Interned so that the dispatch dict lookup on the answer hits the pointer-equality fast path.
+_MAIN_CHOICES = tuple(sys.intern(s) for s in ("Import", "Export", "Edit", "Exit"))
+
+_QUESTION_FACTORIES = {
+    "main_menu_questions": _select("What do you want to do?", _MAIN_CHOICES),
+    "import_menu_questions": _select(
+        "What is your desired source of input?",
+        ["URL", "String", "File", "Go back"],
+    ),
+    "import_menu_questions2": lambda: _get_questionary().path(
+        "Please enter the json in a single line or the source in a single line:"
+    ),
+    "export_menu_questions": _export_menu_questions,
+    "export_menu_questions2": _text("Please enter the target path"),
+    "edit_menu_questions": _select(
+        "What do you want to do?",
+        [
+            "Add Operating System Breed",
+            "Remove Operating System Breed",
+            "Edit the name of an Operating System Breed",
+            "Add Operating System Version",
+            "Remove Operating System Version",
+            "Edit the information of an Operating System Version",
+            "Start from scratch",
             "Go back",
         ],
-    }
-]
-
-edit_menu_breed_version_signatures_add = questionary.text(
-    "What should the name of the new entry be?"
-)
-
-edit_menu_breed_version_signatures_edit = [
-    {
-        # TODO: Change this to a select since we always know what is in there.
-        "type": "text",
-        "name": "edit_menu_breed_version_signatures",
-        "message": "What signature should be edited?",
-    },
-    {
-        "type": "text",
-        "name": "edit_menu_breed_version_signatures_new",
-        "message": "What shall be the new name of the selected entry?",
-    },
-]
-
-edit_menu_breed_version_signatures_delete = questionary.text(
-    "What signature should be deleted?"
-)
-
-edit_menu_breed_version_version_file = questionary.text(
-    'What shall be the new value for the "version_file"?'
-)
-
-edit_menu_breed_version_version_file_regex = questionary.text(
-    'What shall be the new value for the "version_file_regex"?'
-)
-
-edit_menu_breed_version_kernel_arch = questionary.text(
-    'What shall be the new value for the "kernel_arch"?'
-)
-
-edit_menu_breed_version_kernel_arch_regex = questionary.text(
-    'What shall be the new value for the "kernel_arch_regex"?'
-)
-
-edit_menu_breed_version_supported_arches_add = questionary.text(
-    "What should the name of the new architecture be?"
-)
-
-edit_menu_breed_version_supported_arches_edit = [
-    {
-        # TODO: Change this to a select since we always know what is in there.
-        "type": "text",
-        "name": "edit_menu_breed_version_supported_arches_edit",
-        "message": "What supported architecture shall be edited?",
-    },
-    {
-        "type": "text",
-        "name": "edit_menu_breed_version_supported_arches_edit_new",
-        "message": "What shall be the new name of the selected architecture?",
-    },
-]
-
-edit_menu_breed_version_supported_arches_delete = questionary.text(
-    "What architecture shall be deleted from the operating system version?"
-)
-
-edit_menu_breed_version_supported_repo_breeds_add = questionary.text(
-    "What should the name of the new repository breed be?"
-)
-
-edit_menu_breed_version_supported_repo_breeds_edit = [
-    {
-        # TODO: Change this to a select since we always know what is in there.
-        "type": "text",
-        "name": "edit_menu_breed_version_supported_repo_breeds_edit",
-        "message": "What repository breed shall be edited?",
-    },
-    {
-        "type": "text",
-        "name": "edit_menu_breed_version_supported_repo_breeds_edit_new",
-        "message": "What shall be the new name of the selected repository breed?",
-    },
-]
-
-edit_menu_breed_version_supported_repo_breeds_delete = questionary.text(
-    "What repository breed shall be deleted from the operating system version?"
-)
-
-edit_menu_breed_version_kernel_file = questionary.text(
-    'What should the new value of the "kernel_file" be?'
-)
-
-edit_menu_breed_version_initrd_file = questionary.text(
-    'What should the new value of the "initrd_file" be?'
-)
-
-edit_menu_breed_version_isolinux_ok = questionary.confirm(
-    "Whether to set this to true (y) or not (N)?", default=False
-)
-
-edit_menu_breed_version_default_autoinstall = questionary.text(
-    'What should the new value of the "default_autoinstall" be?'
-)
-
-edit_menu_breed_version_kernel_options = questionary.text(
-    'What should the new value of the "kernel_options" be?'
-)
-
-edit_menu_breed_version_kernel_options_post = questionary.text(
-    'What should the new value of the "kernel_options_post" be?'
-)
-
-edit_menu_breed_version_boot_files_add = questionary.text(
-    "What should the name of the new boot files entry be?"
-)
-
-edit_menu_breed_version_boot_files_edit = [
-    {
-        # TODO: Change this to a select since we always know what is in there.
-        "type": "text",
-        "name": "edit_menu_breed_version_boot_files_edit",
-        "message": "What boot files entry shall be edited?",
-    },
-    {
-        "type": "text",
-        "name": "edit_menu_breed_version_boot_files_edit_new",
-        "message": "What shall be the new name of the selected file entry?",
-    },
-]
-
-edit_menu_breed_version_boot_files_delete = questionary.text(
-    "What boot files entry shall be deleted from the operating system version?"
-)
-
-edit_menu_version_add_remove_edit = questionary.select(
-    "What do you want to do?", choices=["Add", "Edit", "Remove"]
-)
+    ),
+    "edit_add_os_breed": _text(
+        "What should the name of the new Operating System Breed be?"
+    ),
+    "edit_remove_os_breed": _single_select_question(
+        "edit_remove_os_breed",
+        "What Operating System Breed (and all its versions) do you want to remove?",
+    ),
+    "edit_name_os_breed_1": _single_select_question(
+        "edit_name_os_breed_1", "Which Operating System Breed do you want to edit?"
+    ),
+    "edit_name_os_breed_2": _text("What shall be the new name?"),
+    "edit_add_os_version_1": _single_select_question(
+        "edit_add_os_version_1",
+        "Under what Operating System Breed shall the new Version be put?",
+    ),
+    "edit_add_os_version_2": lambda: [
+        {
+            "type": "text",
+            "name": "edit_add_os_version_2",
+            "message": "What shall be the name of the new version?",
+        }
+    ],
+    "edit_remove_os_version_1": _single_select_question(
+        "edit_remove_os_version_1",
+        "In what Operating System Breed is the to be removed OS Version?",
+    ),
+    "edit_remove_os_version_2": _single_select_question(
+        "edit_remove_os_version_2", "What is the version that you wish to remove?"
+    ),
+    "edit_information_os_version_which": _single_select_question(
+        "edit_information_os_version_which",
+        "In which operating system breed should the version be?",
+    ),
+    "edit_information_os_version_which_2": _single_select_question(
+        "edit_information_os_version_which_2",
+        "Which operating system version details do you want to edit?",
+    ),
+    "edit_information_os_version": lambda: [
+        {
+            "type": "select",
+            "name": "edit_information_os_version",
+            "message": "What key of the Signatures do you want to edit?",
+            "choices": [
+                "signatures",
+                "version_file",
+                "version_file_regex",
+                "kernel_arch",
+                "kernel_arch_regex",
+                "supported_arches",
+                "supported_repo_breeds",
+                "kernel_file",
+                "initrd_file",
+                "isolinux_ok",
+                "default_autoinstall",
+                "kernel_options",
+                "kernel_options_post",
+                "boot_files",
+                "Go back",
+            ],
+        }
+    ],
+    "edit_menu_version_add_remove_edit": _select(
+        "What do you want to do?", ["Add", "Edit", "Remove"]
+    ),
+}
+
+
+@lru_cache(maxsize=None)
+def _question(name: str):
+    """
+    Build (once) and return the question registered under ``name``. Questions a session never visits are never
+    allocated.
+
+    :param name: The key of the question in the factory registry.
+    :return: The question object or the list with the question dictionaries.
+    """
+    return _QUESTION_FACTORIES[name]()
 
 
 # definitions
 
 
+def _text_input(message: str) -> str:
+    """
+    Read a single line of text. For plain text questions the builtin ``input()`` is an order of magnitude faster than
+    spinning up a full prompt_toolkit application, so it is used whenever stdin is a terminal. Piped input keeps the
+    questionary prompt which handles that case gracefully.
+
+    :param message: The message which is shown to the user.
+    :return: The entered text without surrounding whitespace. An aborted prompt results in an empty string.
+    """
+    if sys.stdin is not None and sys.stdin.isatty():
+        try:
+            return input(message + " ").strip()
+        except (EOFError, KeyboardInterrupt):
+            return ""
+    answer = _get_questionary().text(message).ask()
+    return answer.strip() if answer else ""
+
+
+def _ask_required(question, description: str):
+    """
+    Ask a single question and treat an empty or cancelled answer as "go back". questionary returns ``None`` when the
+    prompt is cancelled via Ctrl-C, so both cases end up here instead of being checked at every call site.
+
+    :param question: The question object to ask.
+    :param description: A short description of the expected input. Used for the error message.
+    :return: The answer or ``None`` in case the input was empty or the prompt was cancelled.
+    """
+    answer = question.ask()
+    if not answer:
+        print("%s was not entered correctly." % description)
+        return None
+    return answer
+
+
+def _ask_choice(name: str) -> str:
+    """
+    Show one of the cached select questions from the registry and return the chosen entry. The question object is
+    built once on first use and reused for every menu redraw; only asking it allocates.
+
+    :param name: The name of the select question in the registry.
+    :return: The chosen entry or an empty string in case the prompt was cancelled.
+    """
+    answer = _question(name).ask()
+    return sys.intern(answer) if answer else ""
+
+
 def get_os_breed_names() -> list:
     """
     This searches for all names of the operation system breeds in the current instance of the library.
 
     :return: An empty list if no names are found. Otherwise all names of the operating system breeds.
     """
-    if os_signatures is None:
-        raise TypeError("os_signatures object must not be none!")
-    names = []
-    for v in os_signatures.osbreeds:
-        names.append(v.name)
-    return names
+    return _signatures().breed_names
 
 
 def get_os_version_names(breed) -> list:
@@ -345,14 +323,11 @@ def get_os_version_names(breed) -> list:
     :param breed: This is the breed object.
     :return: The list of all names if the breed has them. Otherwise an empty list.
     """
-    if os_signatures is None:
-        raise TypeError("os_signatures object must not be none!")
-    index = os_signatures.get_breed_index_by_name(breed)
-    if index >= 0:
-        return list(os_signatures.osbreeds[index].osversions.keys())
-    else:
+    found_breed = _signatures().get_breed_by_name(breed)
+    if found_breed is None:
         print("Operating System Breed not found. Doing nothing.")
         return []
+    return list(found_breed.osversions.keys())
 
 
 def update_choices(question: list, values: list):
@@ -360,15 +335,12 @@ def update_choices(question: list, values: list):
     Update the choices of the first question to the attached list and add a "Go Back" option.
 
     :param question: The list with the dictionaries with the questions.
-    :param values: The values which will replace the old choices.
+    :param values: The values which will replace the old choices. The list is not mutated.
     """
-    if len(values) == 0:
-        values = []
-    values.append("Go Back")
-
     if not isinstance(question[0], dict):
         raise TypeError("First element of list question must be of type dict!")
-    question[0].update({"choices": values})
+    # Build a fresh list so repeated menu visits cannot accumulate stale entries in the shared question object.
+    question[0]["choices"] = [*values, "Go Back"]
 
 
 def prepare_version_edit_information_os_version(version):
@@ -393,7 +365,7 @@ def prepare_version_edit_information_os_version(version):
         'kernel_options_post - "%s"' % version.kernel_options_post,
         'boot_files - "%s"' % str(version.boot_files),
     ]
-    update_choices(edit_information_os_version, values)
+    update_choices(_question("edit_information_os_version"), values)
 
 
 def reset_edit_information_os_version():
@@ -416,30 +388,27 @@ def reset_edit_information_os_version():
         "kernel_options_post",
         "boot_files",
     ]
-    update_choices(edit_information_os_version, values)
+    update_choices(_question("edit_information_os_version"), values)
 
 
 def import_menu():
     """
     Second level menu with the purpose to catch all functionality related to importing the data from a source.
     """
-    choice_import_menu = import_menu_questions.ask()
+    choice_import_menu = _ask_choice("import_menu_questions")
     if choice_import_menu in ["URL", "File", "String"]:
-        result_import_menu_2 = import_menu_questions2.ask()
         if choice_import_menu == "URL":
             import_type = ImportTypes.URL
         elif choice_import_menu == "File":
             import_type = ImportTypes.FILE
-        elif choice_import_menu == "String":
-            import_type = ImportTypes.STRING
         else:
+            import_type = ImportTypes.STRING
+        input_import_source = _ask_required(
+            _question("import_menu_questions2"), "Source"
+        )
+        if input_import_source is None:
             return
-        input_import_source = result_import_menu_2
-        if input_import_source == "":
-            print("Source was not entered correctly.")
-            return
-        os_signatures.importsignatures(import_type, input_import_source)
-        os_signatures.jsontomodels()
+        _signatures().import_and_build(import_type, input_import_source)
     else:
         print("Unknown import option selected. Returning to main menu.")
 
@@ -448,7 +417,8 @@ def export_menu():
     """
     Second level menu with the purpose to catch all functionality related to exporting the data to a target.
     """
-    export_menu_answers = questionary.prompt(export_menu_questions)
+    os_signatures = _signatures()
+    export_menu_answers = _get_questionary().prompt(_question("export_menu_questions"))
     choice_export_menu = export_menu_answers.get("export_menu_target")
     choice_pretty_print_sort = export_menu_answers.get("export_menu_prettyprint_1")
     choice_pretty_print_indent = export_menu_answers.get("export_menu_prettyprint_2")
@@ -458,19 +428,18 @@ def export_menu():
         choice_pretty_print_indent = int(choice_pretty_print_indent)
 
     if choice_export_menu == "String":
-        print(
-            os_signatures.exportsignatures(
-                ExportTypes.STRING,
-                sort_keys=choice_pretty_print_sort,
-                indent=choice_pretty_print_indent,
-            )
+        # Stream to stdout instead of materializing the whole document first.
+        os_signatures.dump_json(
+            sys.stdout,
+            sort_keys=choice_pretty_print_sort,
+            indent=choice_pretty_print_indent,
         )
+        sys.stdout.write("\n")
     elif choice_export_menu == "File":
-        input_export_menu_2 = export_menu_questions2.ask()
-        if input_export_menu_2 == "":
-            print(
-                "Target path for the file was not entered correctly. Returning to main menu."
-            )
+        input_export_menu_2 = _ask_required(
+            _question("export_menu_questions2"), "Target path for the file"
+        )
+        if input_export_menu_2 is None:
             return
         os_signatures.exportsignatures(
             ExportTypes.FILE,
@@ -489,16 +458,16 @@ def edit_menu():
     """
     Second level menu with the purpose to catch all functionality related to editing the current loaded information.
     """
-    global os_signatures
-    choice_edit_menu = edit_menu_questions.ask()
+    global _os_signatures
+    os_signatures = _signatures()
+    choice_edit_menu = _ask_choice("edit_menu_questions")
     if choice_edit_menu == "Add Operating System Breed":
-        result_edit_add_os_breed = edit_add_os_breed.ask()
-        if not result_edit_add_os_breed:
-            print("Empty Operating System Breed name is not allowed. Skipping add.")
+        result_edit_add_os_breed = _ask_required(
+            _question("edit_add_os_breed"), "The Operating System Breed name"
+        )
+        if result_edit_add_os_breed is None:
             return
-        if result_edit_add_os_breed in [
-            version.name for version in os_signatures.osbreeds
-        ]:
+        if result_edit_add_os_breed in os_signatures.breed_names:
             print(
                 'Chosen name "%s" already in the list of Operating System Breeds.'
                 % result_edit_add_os_breed
@@ -510,48 +479,54 @@ def edit_menu():
             % len(os_signatures.osbreeds)
         )
     elif choice_edit_menu == "Remove Operating System Breed":
-        update_choices(edit_remove_os_breed, get_os_breed_names())
-        result_edit_remove_os_breed = questionary.prompt(edit_remove_os_breed)
+        question = _question("edit_remove_os_breed")
+        update_choices(question, get_os_breed_names())
+        result_edit_remove_os_breed = _get_questionary().prompt(question)
         name_to_find = result_edit_remove_os_breed["edit_remove_os_breed"]
         index = os_signatures.get_breed_index_by_name(name_to_find)
-        if (
-            index != -1
-            and result_edit_remove_os_breed == os_signatures.osbreeds[index].name
-        ):
+        if index != -1:
             os_signatures.removeosbreed(index)
         else:
             print("Operating System Breed not found. Doing nothing.")
     elif choice_edit_menu == "Edit the name of an Operating System Breed":
-        update_choices(edit_name_os_breed_1, get_os_breed_names())
-        result_edit_name_os_breed_1 = questionary.prompt(edit_name_os_breed_1)
+        question = _question("edit_name_os_breed_1")
+        update_choices(question, get_os_breed_names())
+        result_edit_name_os_breed_1 = _get_questionary().prompt(question)
         name_to_find = result_edit_name_os_breed_1["edit_name_os_breed_1"]
         index = os_signatures.get_breed_index_by_name(name_to_find)
-        if index != -1 and name_to_find == os_signatures.osbreeds[index].name:
-            result_edit_name_os_breed_2 = edit_name_os_breed_2.ask()
-            os_signatures.osbreeds[index].name = result_edit_name_os_breed_2
+        if index != -1:
+            result_edit_name_os_breed_2 = _ask_required(
+                _question("edit_name_os_breed_2"), "The new name"
+            )
+            if result_edit_name_os_breed_2 is None:
+                return
+            os_signatures.renameosbreed(index, result_edit_name_os_breed_2)
         else:
             print("Operating System Breed not found. Doing nothing.")
     elif choice_edit_menu == "Add Operating System Version":
-        update_choices(edit_add_os_version_1, get_os_breed_names())
-        result_edit_add_os_version_1 = questionary.prompt(edit_add_os_version_1)
+        question = _question("edit_add_os_version_1")
+        update_choices(question, get_os_breed_names())
+        result_edit_add_os_version_1 = _get_questionary().prompt(question)
         name_to_find = result_edit_add_os_version_1["edit_add_os_version_1"]
         index = os_signatures.get_breed_index_by_name(name_to_find)
-        if index != -1 and name_to_find == os_signatures.osbreeds[index].name:
-            result_edit_add_os_version_2 = questionary.prompt(edit_add_os_version_2)
+        if index != -1:
+            result_edit_add_os_version_2 = _get_questionary().prompt(
+                _question("edit_add_os_version_2")
+            )
             name_to_find_1 = result_edit_add_os_version_2["edit_add_os_version_2"]
             os_signatures.addosversion(index, name_to_find_1, None)
         else:
             print("Operating System Breed not found. Doing nothing.")
     elif choice_edit_menu == "Remove Operating System Version":
-        update_choices(edit_remove_os_version_1, get_os_breed_names())
-        result_edit_remove_os_version_1 = questionary.prompt(edit_remove_os_version_1)
+        question = _question("edit_remove_os_version_1")
+        update_choices(question, get_os_breed_names())
+        result_edit_remove_os_version_1 = _get_questionary().prompt(question)
         name_to_find = result_edit_remove_os_version_1["edit_remove_os_version_1"]
         index = os_signatures.get_breed_index_by_name(name_to_find)
-        if index != -1 and name_to_find == os_signatures.osbreeds[index].name:
-            update_choices(edit_remove_os_version_2, get_os_version_names(name_to_find))
-            result_edit_remove_os_version_2 = questionary.prompt(
-                edit_remove_os_version_2
-            )
+        if index != -1:
+            question = _question("edit_remove_os_version_2")
+            update_choices(question, get_os_version_names(name_to_find))
+            result_edit_remove_os_version_2 = _get_questionary().prompt(question)
             name_to_find_1 = result_edit_remove_os_version_2["edit_remove_os_version_2"]
             os_signatures.removeosversion(index, name_to_find_1)
         else:
@@ -559,139 +534,115 @@ def edit_menu():
     elif choice_edit_menu == "Edit the information of an Operating System Version":
         edit_menu_breed_version_info()
     elif choice_edit_menu == "Start from scratch":
-        os_signatures = Signatures()
+        _os_signatures = Signatures()
     elif choice_edit_menu == "Go Back":
         return
     else:
         print("Unknown option selected. Returning to the main menu.")
 
 
-def edit_menu_breed_version_info_signatures(my_osversion):
+_SET_FIELD_PROMPTS = {
+    "signatures": (
+        "What should the name of the new entry be?",
+        "What signature should be edited?",
+        "What shall be the new name of the selected entry?",
+        "What signature should be deleted?",
+    ),
+    "supported_arches": (
+        "What should the name of the new architecture be?",
+        "What supported architecture shall be edited?",
+        "What shall be the new name of the selected architecture?",
+        "What architecture shall be deleted from the operating system version?",
+    ),
+    "supported_repo_breeds": (
+        "What should the name of the new repository breed be?",
+        "What repository breed shall be edited?",
+        "What shall be the new name of the selected repository breed?",
+        "What repository breed shall be deleted from the operating system version?",
+    ),
+    "boot_files": (
+        "What should the name of the new boot files entry be?",
+        "What boot files entry shall be edited?",
+        "What shall be the new name of the selected file entry?",
+        "What boot files entry shall be deleted from the operating system version?",
+    ),
+}
+
+# Maps a scalar field of an Osversion to the type of its value. The type picks the prompt, the assignment itself is
+# a uniform setattr. The set valued fields are the keys of _SET_FIELD_PROMPTS.
+_SCALAR_FIELDS = {
+    "version_file": str,
+    "version_file_regex": str,
+    "kernel_arch": str,
+    "kernel_arch_regex": str,
+    "kernel_file": str,
+    "initrd_file": str,
+    "isolinux_ok": bool,
+    "default_autoinstall": str,
+    "kernel_options": str,
+    "kernel_options_post": str,
+}
+# TODO: Validation of arches and repository breeds (only with warning)
+# TODO: Filename validation for default_autoinstall
+
+
+def _ask_scalar_field(field: str):
     """
-    Fourth level menu to edit the ``signatures`` of an :class:`Osversion`.
+    Ask for the new value of a scalar field of an :class:`Osversion`. One prompt covers all fields instead of one
+    handwritten question per field; plain text fields take the ``input()`` fast path.
 
-    :param my_osversion: The Osversion to edit.
+    :param field: The name of the field to ask for.
+    :return: The new value for the field.
     """
-    result_signatures_choice = edit_menu_version_add_remove_edit.ask()
-    if result_signatures_choice == "Add":
-        new_value_signature = edit_menu_breed_version_signatures_add.ask()
-        my_osversion.signatures.add(new_value_signature)
-    elif result_signatures_choice == "Edit":
-        new_value_edit_signatures = questionary.prompt(
-            edit_menu_breed_version_signatures_edit
+    if _SCALAR_FIELDS[field] is bool:
+        return (
+            _get_questionary()
+            .confirm("Whether to set this to true (y) or not (N)?", default=False)
+            .ask()
         )
-        try:
-            my_osversion.signatures.remove(
-                new_value_edit_signatures["edit_menu_breed_version_signatures"]
-            )
-        except KeyError:
-            print("Chosen key not found. Aborting value edit of signatures!")
-            return
-        my_osversion.signatures.add(
-            new_value_edit_signatures["edit_menu_breed_version_signatures_new"]
-        )
-    elif result_signatures_choice == "Remove":
-        value_to_be_removed = edit_menu_breed_version_signatures_delete.ask()
-        my_osversion.signatures.remove(value_to_be_removed)
-    else:
-        print("Unknown option selected.")
+    return _text_input('What shall be the new value for the "%s"?' % field)
 
 
-def edit_menu_breed_version_info_supported_arches(my_osversion):
-    result_supported_arches_choice = edit_menu_version_add_remove_edit.ask()
-    if result_supported_arches_choice == "Add":
-        new_value_supported_arches = edit_menu_breed_version_supported_arches_add.ask()
-        my_osversion.supported_arches.add(new_value_supported_arches)
-    elif result_supported_arches_choice == "Edit":
-        new_value_edit_arches = questionary.prompt(
-            edit_menu_breed_version_supported_arches_edit
-        )
-        try:
-            my_osversion.supported_arches.remove(
-                new_value_edit_arches["edit_menu_breed_version_supported_arches_edit"]
-            )
-        except KeyError:
-            print("Chosen key not found. Aborting value edit of supported_arches!")
-            return
-        my_osversion.supported_arches.add(
-            new_value_edit_arches["edit_menu_breed_version_supported_arches_edit_new"]
-        )
-    elif result_supported_arches_choice == "Remove":
-        value_to_be_removed = edit_menu_breed_version_supported_arches_delete.ask()
-        my_osversion.supported_arches.remove(value_to_be_removed)
-    else:
-        print("Unknown option selected.")
-    # TODO: Validation of arches (only with warning)
-
-
-def edit_menu_breed_version_info_supported_repo_breeds(my_osversion):
-    result_repo_breeds_choice = edit_menu_version_add_remove_edit.ask()
-    if result_repo_breeds_choice == "Add":
-        new_value_supported_repo_breed = (
-            edit_menu_breed_version_supported_repo_breeds_add.ask()
-        )
-        my_osversion.supported_repo_breeds.add(new_value_supported_repo_breed)
-    elif result_repo_breeds_choice == "Edit":
-        new_value_edit_supported_repo_breeds = questionary.prompt(
-            edit_menu_breed_version_supported_repo_breeds_edit
-        )
-        try:
-            my_osversion.supported_repo_breeds.remove(
-                new_value_edit_supported_repo_breeds[
-                    "edit_menu_breed_version_supported_repo_breeds_edit"
-                ]
-            )
-        except KeyError:
-            print("Chosen key not found. Aborting value edit of supported_repo_breeds!")
-            return
-        my_osversion.supported_repo_breeds.add(
-            new_value_edit_supported_repo_breeds[
-                "edit_menu_breed_version_supported_repo_breeds_edit_new"
-            ]
-        )
-    elif result_repo_breeds_choice == "Remove":
-        value_to_be_removed = edit_menu_breed_version_supported_repo_breeds_delete.ask()
-        my_osversion.supported_repo_breeds.remove(value_to_be_removed)
-    else:
-        print("Unknown option selected.")
-    # TODO: Validation for choices (only with warning)
-
+def _edit_set_field(my_osversion, field: str):
+    """
+    Fourth level menu to edit a set valued field of an :class:`Osversion`.
 
-def edit_menu_breed_version_info_boot_files(my_osversion):
-    result_boot_files_choice = edit_menu_version_add_remove_edit.ask()
-    if result_boot_files_choice == "Add":
-        new_value_boot_files_add = edit_menu_breed_version_boot_files_add.ask()
-        my_osversion.boot_files.add(new_value_boot_files_add)
-    elif result_boot_files_choice == "Edit":
-        new_value_edit_boot_files = questionary.prompt(
-            edit_menu_breed_version_boot_files_edit
-        )
+    :param my_osversion: The Osversion to edit.
+    :param field: The name of the set valued field to edit.
+    """
+    add_message, edit_message, edit_new_message, delete_message = _SET_FIELD_PROMPTS[
+        field
+    ]
+    values = getattr(my_osversion, field)
+    choice = _ask_choice("edit_menu_version_add_remove_edit")
+    if choice == "Add":
+        values.add(_text_input(add_message))
+    elif choice == "Edit":
+        old_value = _text_input(edit_message)
+        new_value = _text_input(edit_new_message)
         try:
-            my_osversion.boot_files.remove(
-                new_value_edit_boot_files["edit_menu_breed_version_boot_files_edit"]
-            )
+            values.remove(old_value)
         except KeyError:
-            print("Chosen key not found. Aborting value edit of boot_files!")
+            print("Chosen key not found. Aborting value edit of %s!" % field)
             return
-        my_osversion.boot_files.add(
-            new_value_edit_boot_files["edit_menu_breed_version_boot_files_edit_new"]
-        )
-    elif result_boot_files_choice == "Remove":
-        value_to_be_removed = edit_menu_breed_version_boot_files_delete.ask()
-        my_osversion.boot_files.remove(value_to_be_removed)
+        values.add(new_value)
+    elif choice == "Remove":
+        values.remove(_text_input(delete_message))
     else:
         print("Unknown option selected.")
+        return
+    _signatures().mark_dirty()
 
 
 def edit_menu_breed_version_info():
     """
     Third level menu to edit the information of an :class:`Osversion`.
     """
+    os_signatures = _signatures()
     # Prechoose which OsBreed and OsVersion should be manipulated
-    update_choices(edit_information_os_version_which, get_os_breed_names())
-    choice_edit_information_os_version_which = questionary.prompt(
-        edit_information_os_version_which
-    )
+    question = _question("edit_information_os_version_which")
+    update_choices(question, get_os_breed_names())
+    choice_edit_information_os_version_which = _get_questionary().prompt(question)
     breed_index_name = choice_edit_information_os_version_which[
         "edit_information_os_version_which"
     ]
@@ -700,12 +651,9 @@ def edit_menu_breed_version_info():
     elif breed_index_name == "":
         print("Unknown option selected. Returning to main menu.")
         return
-    update_choices(
-        edit_information_os_version_which_2, get_os_version_names(breed_index_name)
-    )
-    choice_edit_information_os_version_which_2 = questionary.prompt(
-        edit_information_os_version_which_2
-    )
+    question = _question("edit_information_os_version_which_2")
+    update_choices(question, get_os_version_names(breed_index_name))
+    choice_edit_information_os_version_which_2 = _get_questionary().prompt(question)
     my_os_version_name = choice_edit_information_os_version_which_2[
         "edit_information_os_version_which_2"
     ]
@@ -725,83 +673,141 @@ def edit_menu_breed_version_info():
     prepare_version_edit_information_os_version(my_osversion)
 
     # Do the actual editing
-    edit_information_os_version_result = questionary.prompt(edit_information_os_version)
+    edit_information_os_version_result = _get_questionary().prompt(
+        _question("edit_information_os_version")
+    )
     choice_edit_information_os_version = edit_information_os_version_result[
         "edit_information_os_version"
     ]
     print(choice_edit_information_os_version)
-    if choice_edit_information_os_version.startswith("signatures"):
-        edit_menu_breed_version_info_signatures(my_osversion)
-    elif choice_edit_information_os_version.startswith("version_file"):
-        new_value_version_file = edit_menu_breed_version_version_file.ask()
-        my_osversion.version_file = new_value_version_file
-    elif choice_edit_information_os_version.startswith("version_file_regex"):
-        new_value_version_file_regex = edit_menu_breed_version_version_file_regex.ask()
-        my_osversion.version_file_regex = new_value_version_file_regex
-    elif choice_edit_information_os_version.startswith("kernel_arch"):
-        new_value_kernel_arch = edit_menu_breed_version_kernel_arch.ask()
-        my_osversion.kernel_arch = new_value_kernel_arch
-    elif choice_edit_information_os_version.startswith("kernel_arch_regex"):
-        new_value_kernel_arch_regex = edit_menu_breed_version_kernel_arch_regex.ask()
-        my_osversion.kernel_arch_regex = new_value_kernel_arch_regex
-    elif choice_edit_information_os_version.startswith("supported_arches"):
-        edit_menu_breed_version_info_supported_arches(my_osversion)
-    elif choice_edit_information_os_version.startswith("supported_repo_breeds"):
-        edit_menu_breed_version_info_supported_repo_breeds(my_osversion)
-    elif choice_edit_information_os_version.startswith("kernel_file"):
-        new_value_kernel_file = edit_menu_breed_version_kernel_file.ask()
-        my_osversion.kernel_file = new_value_kernel_file
-    elif choice_edit_information_os_version.startswith("initrd_file"):
-        new_value_initrd_file = edit_menu_breed_version_initrd_file.ask()
-        my_osversion.kernel_file = new_value_initrd_file
-    elif choice_edit_information_os_version.startswith("isolinux_ok"):
-        new_value_isolinux_ok = edit_menu_breed_version_isolinux_ok.ask()
-        my_osversion.isolinux_ok = new_value_isolinux_ok
-    elif choice_edit_information_os_version.startswith("default_autoinstall"):
-        # TODO: Filename validation
-        new_value_default_autoinstall = (
-            edit_menu_breed_version_default_autoinstall.ask()
-        )
-        my_osversion.default_autoinstall = new_value_default_autoinstall
-    elif choice_edit_information_os_version.startswith("kernel_options"):
-        new_value_kernel_options = edit_menu_breed_version_kernel_options.ask()
-        my_osversion.kernel_options = new_value_kernel_options
-    elif choice_edit_information_os_version.startswith("kernel_options_post"):
-        new_value_kernel_options_post = (
-            edit_menu_breed_version_kernel_options_post.ask()
-        )
-        my_osversion.kernel_options_post = new_value_kernel_options_post
-    elif choice_edit_information_os_version.startswith("boot_files"):
-        edit_menu_breed_version_info_boot_files(my_osversion)
+    # The choice carries the current value after " - ", so cut it back to the bare field name.
+    field = choice_edit_information_os_version.split(" - ")[0]
+    if field in _SET_FIELD_PROMPTS:
+        _edit_set_field(my_osversion, field)
+    elif field in _SCALAR_FIELDS:
+        setattr(my_osversion, field, _ask_scalar_field(field))
+        os_signatures.mark_dirty()
     else:
         return
     reset_edit_information_os_version()
 
 
-def main():
+_MAIN_DISPATCH = {
+    "Import": import_menu,
+    "Export": export_menu,
+    "Edit": edit_menu,
+}
+
+
+def _build_argument_parser():
+    """
+    Build the argument parser for the batch mode. Kept in a factory so the plain interactive startup does not pay for
+    it until the arguments are actually parsed.
+
+    :return: The configured parser.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Manage Cobbler signature documents. Without arguments an interactive menu is started."
+    )
+    parser.add_argument(
+        "--import-file", metavar="PATH", help="Import the signatures from the given file."
+    )
+    parser.add_argument(
+        "--import-url", metavar="URL", help="Import the signatures from the given URL."
+    )
+    parser.add_argument(
+        "--import-string",
+        metavar="JSON",
+        help="Import the signatures from the given JSON string.",
+    )
+    parser.add_argument(
+        "--add-breed",
+        action="append",
+        default=[],
+        metavar="NAME",
+        help="Add an operating system breed with the given name. May be given multiple times.",
+    )
+    parser.add_argument(
+        "--export-file", metavar="PATH", help="Export the signatures to the given file."
+    )
+    parser.add_argument(
+        "--export-string",
+        action="store_true",
+        help="Export the signatures to stdout.",
+    )
+    parser.add_argument(
+        "--sort-keys",
+        action="store_true",
+        help="Sort the keys of the exported JSON.",
+    )
+    parser.add_argument(
+        "--indent",
+        type=int,
+        metavar="N",
+        help="Pretty print the exported JSON with the given indentation.",
+    )
+    return parser
+
+
+def _run_batch(args) -> bool:
+    """
+    Execute the actions requested via the command line. This path never shows a prompt and thus never imports the
+    prompt library, which keeps scripted invocations cheap.
+
+    :param args: The namespace with the parsed arguments.
+    :return: ``True`` in case at least one batch action was executed, otherwise ``False``.
+    """
+    os_signatures = _signatures()
+    ran_batch_action = False
+    if args.import_file:
+        os_signatures.import_and_build(ImportTypes.FILE, args.import_file)
+        ran_batch_action = True
+    elif args.import_url:
+        os_signatures.import_and_build(ImportTypes.URL, args.import_url)
+        ran_batch_action = True
+    elif args.import_string:
+        os_signatures.import_and_build(ImportTypes.STRING, args.import_string)
+        ran_batch_action = True
+    for name in args.add_breed:
+        os_signatures.addosbreed(name)
+        ran_batch_action = True
+    if args.export_file:
+        with open(args.export_file, "w") as f:
+            os_signatures.dump_json(f, args.sort_keys, args.indent)
+        ran_batch_action = True
+    if args.export_string:
+        os_signatures.dump_json(sys.stdout, args.sort_keys, args.indent)
+        sys.stdout.write("\n")
+        ran_batch_action = True
+    return ran_batch_action
+
+
+def main(argv=None):
     """
     The main entrypoint for the CLI. This is called when you execute the CLI. The exitcode of the application is zero.
-    This is a first level menu.
-    """
-    main_menu_option_selected = 0
-    while main_menu_option_selected != 3:
-        chosen_option = main_menu_questions.ask()
-        if chosen_option == "Import":
-            main_menu_option_selected = 0
-            import_menu()
-        elif chosen_option == "Export":
-            main_menu_option_selected = 1
-            export_menu()
-        elif chosen_option == "Edit":
-            main_menu_option_selected = 2
-            edit_menu()
-        elif chosen_option == "Exit":
-            main_menu_option_selected = 3
-            print("Any progress which is not exported will be lost. Bye.")
-        else:
-            main_menu_option_selected = -1
-            print("Unknown option chosen. Redisplaying menu.")
-    exit(0)
+    If batch arguments are given they are executed without showing any menu, otherwise this is a first level menu.
+
+    :param argv: The command line arguments. Defaults to ``sys.argv[1:]``.
+    """
+    args = _build_argument_parser().parse_args(argv)
+    if _run_batch(args):
+        return
+    try:
+        while True:
+            chosen_option = _ask_choice("main_menu_questions")
+            if chosen_option == "Exit":
+                break
+            handler = _MAIN_DISPATCH.get(chosen_option)
+            if handler is None:
+                print("Unknown option chosen. Redisplaying menu.")
+                continue
+            handler()
+    except (EOFError, KeyboardInterrupt):
+        pass
+    print("Any progress which is not exported will be lost. Bye.")
+    sys.exit(0)
 
 
 if __name__ == "__main__":
@@ -2,12 +2,14 @@
 This module contains all enums which are used in the library.
 """
 
-from enum import Enum
+from enum import Enum, IntEnum
+from types import MappingProxyType
 
 
-class OsArchitectures(Enum):
+class OsArchitectures(IntEnum):
     """
-    An enumeration which defines the in Cobbler available architectures.
+    An enumeration which defines the in Cobbler available architectures. An ``IntEnum`` so that comparisons against
+    the member values are plain integer compares.
     """
 
     i386 = 1
@@ -32,9 +34,20 @@ class OsArchitectures(Enum):
     """
 
 
-class RepositoryBreeds(Enum):
+# Frozen lookup maps so that converting a decoded name or value into a member is one dict hit instead of a call
+# into EnumMeta.__getitem__.
+OsArchitectures._BY_NAME = MappingProxyType(
+    {member.name: member for member in OsArchitectures}
+)
+OsArchitectures._BY_VALUE = MappingProxyType(
+    {member.value: member for member in OsArchitectures}
+)
+
+
+class RepositoryBreeds(IntEnum):
     """
-    An enumeration which defines the in Cobbler available repository breeds.
+    An enumeration which defines the in Cobbler available repository breeds. An ``IntEnum`` so that comparisons
+    against the member values are plain integer compares.
     """
 
     rsync = 1
@@ -55,6 +68,14 @@ class RepositoryBreeds(Enum):
     """
 
 
+RepositoryBreeds._BY_NAME = MappingProxyType(
+    {member.name: member for member in RepositoryBreeds}
+)
+RepositoryBreeds._BY_VALUE = MappingProxyType(
+    {member.value: member for member in RepositoryBreeds}
+)
+
+
 class ImportTypes(Enum):
     """
     An enumeration which defines the possible sources for importing the JSON file.
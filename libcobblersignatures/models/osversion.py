@@ -3,8 +3,100 @@ Module for the datastructure of an operating system version. An operating system
 operating system breed.
 """
 
+import json
+from copy import deepcopy
+from sys import intern
+
 from libcobblersignatures import utils
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# One entry per field: the public name, the expected type and the factory for the default value. This is the
+# single declarative description of the shape of an Osversion. The names double as the JSON keys and are
+# interned so the dict lookups in encode()/decode() take the pointer-equality fast path.
+_FIELDS = tuple(
+    (intern(name), field_type, default_factory)
+    for name, field_type, default_factory in (
+        ("signatures", set, set),
+        ("version_file", str, str),
+        ("version_file_regex", str, str),
+        ("kernel_arch", str, str),
+        ("kernel_arch_regex", str, str),
+        ("supported_arches", set, set),
+        ("supported_repo_breeds", set, set),
+        ("kernel_file", str, str),
+        ("initrd_file", str, str),
+        ("isolinux_ok", bool, bool),
+        ("default_autoinstall", str, str),
+        ("kernel_options", str, str),
+        ("kernel_options_post", str, str),
+        ("template_files", str, str),
+        ("boot_files", set, set),
+        ("boot_loaders", dict, dict),
+    )
+)
+
+# The storage slot names in the order of _FIELDS, precomputed once instead of concatenating per access.
+_SLOTS = tuple("_" + name for name, _, _ in _FIELDS)
+
+
+def _raise_type(field: str, expected_type: type):
+    """
+    Raise the uniform TypeError for a rejected field value.
+
+    :param field: The name of the field whose assignment was rejected.
+    :param expected_type: The type the field expects.
+    :raises TypeError: Always, with the field name and expected type in the message.
+    """
+    raise TypeError("The %s should be a %s." % (field, expected_type.__name__))
+
+
+class _TypedProperty:
+    """
+    Data descriptor which replaces the formerly hand-written property triples of :class:`Osversion`. The setter
+    validates the value against the expected type, the deleter resets the field to its default instead of removing
+    the attribute. Fields of type set additionally accept a list and convert it to a set.
+    """
+
+    def __init__(self, expected_type: type, doc: str, reset_factory=None):
+        """
+        :param expected_type: The type a value must have to pass the setter.
+        :param doc: The docstring which is shown for the attribute.
+        :param reset_factory: The factory for the value the deleter resets to. Defaults to the zero value of the
+                              expected type.
+        """
+        self.type = expected_type
+        self.reset_factory = reset_factory if reset_factory is not None else expected_type
+        self.__doc__ = doc
+        self.name = ""
+        self.slot = ""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.slot = "_" + name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return getattr(obj, self.slot)
+
+    def __set__(self, obj, value):
+        # Values coming from json.loads always carry the exact type, so the pointer compare hits first and the
+        # isinstance fallback only runs for subclasses.
+        if type(value) is self.type or isinstance(value, self.type):
+            setattr(obj, self.slot, value)
+        elif self.type is set and isinstance(value, list):
+            setattr(obj, self.slot, set(value))
+        else:
+            _raise_type(self.name, self.type)
+
+    def __delete__(self, obj):
+        setattr(obj, self.slot, self.reset_factory())
+
 
 class Osversion:
     """
@@ -12,26 +104,26 @@ class Osversion:
     values are valid are described in the JSON specification.
     """
 
+    # A signature catalog holds one object per version, so skipping the per-instance dict pays off in bulk decodes.
+    __slots__ = _SLOTS
+
+    _FIELDS = _FIELDS
+
     def __init__(self):
         """
         Creates default values for all values.
         """
-        self._signatures = set()
-        self._version_file = ""
-        self._version_file_regex = ""
-        self._kernel_arch = ""
-        self._kernel_arch_regex = ""
-        self._supported_arches = set()
-        self._supported_repo_breeds = set()
-        self._kernel_file = ""
-        self._initrd_file = ""
-        self._isolinux_ok = False
-        self._default_autoinstall = ""
-        self._kernel_options = ""
-        self._kernel_options_post = ""
-        self._template_files = ""
-        self._boot_files = set()
-        self._boot_loaders = {}
+        for slot, (_, _, default_factory) in zip(_SLOTS, _FIELDS):
+            object.__setattr__(self, slot, default_factory())
+
+    def _state(self) -> tuple:
+        """
+        Collect the values of all fields in the order of ``_FIELDS``. The slots are read directly so no property
+        getter is involved.
+
+        :return: The tuple with the values of all fields.
+        """
+        return tuple(getattr(self, slot) for slot in _SLOTS)
 
     def __eq__(self, other) -> bool:
         """
@@ -43,61 +135,47 @@ class Osversion:
         """
         if not isinstance(other, Osversion):
             return NotImplemented
-        return (
-            self.signatures == other.signatures
-            and self.version_file == other.version_file
-            and self.version_file_regex == other.version_file_regex
-            and self.kernel_arch == other.kernel_arch
-            and self.kernel_arch_regex == other.kernel_arch_regex
-            and self.supported_arches == other.supported_arches
-            and self.supported_repo_breeds == other.supported_repo_breeds
-            and self.kernel_file == other.kernel_file
-            and self.initrd_file == other.initrd_file
-            and self.isolinux_ok == other.isolinux_ok
-            and self.default_autoinstall == other.default_autoinstall
-            and self.kernel_options == other.kernel_options
-            and self.kernel_options_post == other.kernel_options_post
-            and self.template_files == other._template_files
-            and self.boot_files == other.boot_files
-            and self.boot_loaders == other.boot_loaders
-        )
-
-    @property
-    def signatures(self) -> set:
-        """
-        This is a list of strings with currently an unknown functionality.
+        return self._state() == other._state()
 
-        :setter: May raise a TypeError in case the value was not of type list.
-        :getter: Returns the last correctly validated str of the property.
-        :deleter: Resets this to an empty list.
-        :type: set
+    def __copy__(self) -> "Osversion":
         """
-        return self._signatures
+        Create a shallow copy of this version by cloning the slots directly.
 
-    @signatures.setter
-    def signatures(self, value: set):
+        :return: The new version which shares the collection values with this one.
         """
-        Setter for the signatures.
+        new = Osversion.__new__(Osversion)
+        for slot in _SLOTS:
+            object.__setattr__(new, slot, getattr(self, slot))
+        return new
 
-        :param value: The list with the signatures.
-        :raises TypeError: In case the value was not of of type list.
+    def __deepcopy__(self, memo: dict) -> "Osversion":
         """
-        if isinstance(value, set):
-            self._signatures = value
-        elif isinstance(value, list):
-            self._signatures = set(value)
-        else:
-            raise TypeError("Signatures should be a set.")
+        Create a deep copy of this version. Cloning the slots directly skips the generic reflection the copy module
+        would otherwise run over the instance state.
 
-    @signatures.deleter
-    def signatures(self):
+        :param memo: The memo dictionary handed over by the copy module.
+        :return: The new fully independent version.
         """
-        Resets the value of the signatures to an emtpy list.
+        new = Osversion.__new__(Osversion)
+        memo[id(self)] = new
+        for slot in _SLOTS:
+            object.__setattr__(new, slot, deepcopy(getattr(self, slot), memo))
+        return new
+
+    signatures = _TypedProperty(
+        set,
         """
-        self._signatures = set()
+        This is a list of strings with currently an unknown functionality.
+
+        :setter: May raise a TypeError in case the value was not of type list.
+        :getter: Returns the last correctly validated str of the property.
+        :deleter: Resets this to an empty list.
+        :type: set
+        """,
+    )
 
-    @property
-    def version_file(self) -> str:
+    version_file = _TypedProperty(
+        str,
         """
         The regular expression which points to the file with the os-version info.
 
@@ -105,31 +183,11 @@ class Osversion:
         :getter: Returns the last correctly validated str of the property.
         :deleter: Resets this to an empty string.
         :type: str
-        """
-        return self._version_file
+        """,
+    )
 
-    @version_file.setter
-    def version_file(self, value: str):
-        """
-        Setter for the version_file.
-
-        :param value: The string which will become the version file.
-        :raises TypeError: In case the value is not a str.
-        """
-        if isinstance(value, str):
-            self._version_file = value
-        else:
-            raise TypeError("The version_file should be a str.")
-
-    @version_file.deleter
-    def version_file(self):
-        """
-        Resets the version_file to an empty string instead of deleting the attribute.
-        """
-        self._version_file = ""
-
-    @property
-    def version_file_regex(self) -> str:
+    version_file_regex = _TypedProperty(
+        str,
         """
         The regular expression which tells Cobbler to pick this version if it matches.
 
@@ -137,32 +195,11 @@ class Osversion:
         :setter: Validates the regex and raises in case an error was detected (TypeError).
         :deleter: Resets the attribute to an empty str instead of deleting it.
         :type: str
-        """
-        return self._version_file_regex
-
-    @version_file_regex.setter
-    def version_file_regex(self, value: str):
-        """
-        Setter for the version_file_regex.
-
-        :param value: The str with the new value.
-        :raises TypeError: In case the regex was not of type str.
-        """
-        if isinstance(value, str):
-            # TODO validate regex - regex syntax
-            self._version_file_regex = value
-        else:
-            raise TypeError("The version_file_regex should be a str.")
+        """,
+    )
 
-    @version_file_regex.deleter
-    def version_file_regex(self):
-        """
-        Resets the version_file_regex to an empty string instead of deleting the attribute.
-        """
-        self._version_file_regex = ""
-
-    @property
-    def kernel_arch(self) -> str:
+    kernel_arch = _TypedProperty(
+        str,
         """
         The regular expression which tells Cobbler where to look for the architecture of the operating system.
         In some cases this may also be a path to the file where Cobbler should look for the architecture.
@@ -171,31 +208,11 @@ class Osversion:
         :setter: May raise a TypeError in case the value was not of type str.
         :deleter: Resets the value instead of deleting the attribute.
         :type: str
-        """
-        return self._kernel_arch
-
-    @kernel_arch.setter
-    def kernel_arch(self, value: str):
-        """
-        Setter for the kernel_arch.
-
-        :param value: The new str for the kernel_arch.
-        :raises TypeError: In case ``value`` was not of type str.
-        """
-        if isinstance(value, str):
-            self._kernel_arch = value
-        else:
-            raise TypeError("The kernel_arch should be a str.")
-
-    @kernel_arch.deleter
-    def kernel_arch(self):
-        """
-        Resets the kernel_arch to an empty string instead of deleting the attribute.
-        """
-        self._kernel_arch = ""
+        """,
+    )
 
-    @property
-    def kernel_arch_regex(self) -> str:
+    kernel_arch_regex = _TypedProperty(
+        str,
         """
         In case ``kernel_arch`` does not point to the architecture directly, this is the regex where Cobbler looks for
         in the file specified by ``kernel_arch``.
@@ -204,32 +221,11 @@ class Osversion:
         :setter: Will set this if the validation succeeds, otherwise will raise an exception (TypeError).
         :deleter: Resets this to an empty str.
         :type: str
-        """
-        return self._kernel_arch_regex
-
-    @kernel_arch_regex.setter
-    def kernel_arch_regex(self, value: str):
-        """
-        Setter for the kernel_arch_regex.
-
-        :param value: The new str for the ``kernel_arch_regex``.
-        :raises TypeError: In case value was not of type str.
-        """
-        if isinstance(value, str):
-            # TODO validate regex - regex syntax
-            self._kernel_arch_regex = value
-        else:
-            raise TypeError("The kernel_arch_regex should be a str.")
+        """,
+    )
 
-    @kernel_arch_regex.deleter
-    def kernel_arch_regex(self):
-        """
-        Resets the kernel_arch_regex to an empty string instead of deleting the attribute.
-        """
-        self._kernel_arch_regex = ""
-
-    @property
-    def supported_arches(self) -> set:
+    supported_arches = _TypedProperty(
+        set,
         """
         Unused field currently. There for compatibility reasons for now.
 
@@ -237,33 +233,11 @@ class Osversion:
         :setter: Will set this if the validation succeeds, otherwise will raise an exception (TypeError).
         :deleter: Resets this to an empty list.
         :type: set
-        """
-        return self._supported_arches
-
-    @supported_arches.setter
-    def supported_arches(self, value: set):
-        """
-        Setter for the supported_arches.
+        """,
+    )
 
-        :param value: The new list for the ``supported_arches``.
-        :raises TypeError: In case value is not of type list.
-        """
-        if isinstance(value, set):
-            self._supported_arches = value
-        elif isinstance(value, list):
-            self._supported_arches = set(value)
-        else:
-            raise TypeError("The supported_arches should be a set.")
-
-    @supported_arches.deleter
-    def supported_arches(self):
-        """
-        Resets the supported_arches to an empty list instead of deleting the attribute.
-        """
-        self._supported_arches = set()
-
-    @property
-    def supported_repo_breeds(self) -> set:
+    supported_repo_breeds = _TypedProperty(
+        set,
         """
         Unused field currently. There for compatibility reasons for now.
 
@@ -271,33 +245,12 @@ class Osversion:
         :setter: Will set this if the validation succeeds, otherwise will raise an exception (TypeError).
         :deleter: Resets this to an empty list.
         :type: set
-        """
-        return self._supported_repo_breeds
-
-    @supported_repo_breeds.setter
-    def supported_repo_breeds(self, value: set):
-        """
-        Setter for supported_repo_breeds.
-
-        :param value: The new list for the ``supported_repo_breeds``.
-        :raises TypeError: In case value is not of type list.
-        """
-        if isinstance(value, set):
-            self._supported_repo_breeds = value
-        elif isinstance(value, list):
-            self._supported_repo_breeds = set(value)
-        else:
-            raise TypeError("The supported_repo_breeds should be a set.")
+        """,
+        reset_factory=list,
+    )
 
-    @supported_repo_breeds.deleter
-    def supported_repo_breeds(self):
-        """
-        Resets the supported_repo_breeds to an empty list instead of deleting the attribute.
-        """
-        self._supported_repo_breeds = []
-
-    @property
-    def kernel_file(self) -> str:
+    kernel_file = _TypedProperty(
+        str,
         """
         The regular expression to match to find the kernel.
 
@@ -305,31 +258,11 @@ class Osversion:
         :setter: Will set this if the validation succeeds, otherwise will raise an exception (TypeError).
         :deleter: Resets this to an empty str.
         :type: str
-        """
-        return self._kernel_file
-
-    @kernel_file.setter
-    def kernel_file(self, value: str):
-        """
-        Setter for the kernel_file.
-
-        :param value: The new str for the ``kernel_file``.
-        :raises TypeError: In case value is not of type str.
-        """
-        if isinstance(value, str):
-            self._kernel_file = value
-        else:
-            raise TypeError("The kernel_file should be a str.")
-
-    @kernel_file.deleter
-    def kernel_file(self):
-        """
-        Resets the kernel_file to an empty string instead of deleting the attribute.
-        """
-        self._kernel_file = ""
+        """,
+    )
 
-    @property
-    def initrd_file(self) -> str:
+    initrd_file = _TypedProperty(
+        str,
         """
         The regular expression to match to find the initrd.
 
@@ -337,31 +270,11 @@ class Osversion:
         :setter: Will set this if the validation succeeds, otherwise will raise an exception (TypeError).
         :deleter: Resets this to an empty str.
         :type: str
-        """
-        return self._initrd_file
-
-    @initrd_file.setter
-    def initrd_file(self, value: str):
-        """
-        Setter for the initrd_file.
-
-        :param value: The new str for the ``initrd_file``.
-        :raises TypeError: In case value is not of type str.
-        """
-        if isinstance(value, str):
-            self._initrd_file = value
-        else:
-            raise TypeError("The initrd_file should be a str.")
-
-    @initrd_file.deleter
-    def initrd_file(self):
-        """
-        Resets the initrd_file to an empty string instead of deleting the attribute.
-        """
-        self._initrd_file = ""
+        """,
+    )
 
-    @property
-    def isolinux_ok(self) -> bool:
+    isolinux_ok = _TypedProperty(
+        bool,
         """
         Unknown field currently. There for compatibility reasons for now.
 
@@ -369,31 +282,11 @@ class Osversion:
         :setter: Will set this if the validation succeeds, otherwise will raise an exception (TypeError).
         :deleter: Resets this to ``False``.
         :type: bool
-        """
-        return self._isolinux_ok
-
-    @isolinux_ok.setter
-    def isolinux_ok(self, value: bool):
-        """
-        Setter for isolinux_ok.
-
-        :param value: The new bool for ``isolinux_ok``.
-        :raises TypeError: In case value is not of type bool.
-        """
-        if isinstance(value, bool):
-            self._isolinux_ok = value
-        else:
-            raise TypeError("The isolinux_ok should be a bool.")
-
-    @isolinux_ok.deleter
-    def isolinux_ok(self):
-        """
-        Resets the isolinux_ok to ``False`` instead of deleting the attribute.
-        """
-        self._isolinux_ok = False
+        """,
+    )
 
-    @property
-    def default_autoinstall(self) -> str:
+    default_autoinstall = _TypedProperty(
+        str,
         """
         The filename for the default autoinstall template in Cobbler.
 
@@ -401,31 +294,11 @@ class Osversion:
         :setter: Will set this if the validation succeeds, otherwise will raise an exception (TypeError).
         :deleter: Resets this to an empty str.
         :type: str
-        """
-        return self._default_autoinstall
-
-    @default_autoinstall.setter
-    def default_autoinstall(self, value: str):
-        """
-        Setter for default_autoinstall.
+        """,
+    )
 
-        :param value: The new str for the ``default_autoinstall``.
-        :raises TypeError: In case value is not of type str.
-        """
-        if isinstance(value, str):
-            self._default_autoinstall = value
-        else:
-            raise TypeError("The default_autoinstall should be a str.")
-
-    @default_autoinstall.deleter
-    def default_autoinstall(self):
-        """
-        Resets the default_autoinstall to an empty string instead of deleting the attribute.
-        """
-        self._default_autoinstall = ""
-
-    @property
-    def kernel_options(self) -> str:
+    kernel_options = _TypedProperty(
+        str,
         """
         Default kernel options to apply to the imported ISO.
 
@@ -433,31 +306,11 @@ class Osversion:
         :setter: Will set this if the validation succeeds, otherwise will raise an exception (TypeError).
         :deleter: Resets this to an empty str.
         :type: str
-        """
-        return self._kernel_options
-
-    @kernel_options.setter
-    def kernel_options(self, value: str):
-        """
-        Setter for kernel_options.
-
-        :param value: The new str for the ``kernel_options``.
-        :raises TypeError: In case value is not of type str.
-        """
-        if isinstance(value, str):
-            self._kernel_options = value
-        else:
-            raise TypeError("The kernel_options should be a str.")
+        """,
+    )
 
-    @kernel_options.deleter
-    def kernel_options(self):
-        """
-        Resets the kernel_options to an empty string instead of deleting the attribute.
-        """
-        self._kernel_options = ""
-
-    @property
-    def kernel_options_post(self) -> str:
+    kernel_options_post = _TypedProperty(
+        str,
         """
         Default kernel post options to apply to the imported ISO.
 
@@ -465,31 +318,11 @@ class Osversion:
         :setter: Will set this if the validation succeeds, otherwise will raise an exception (TypeError).
         :deleter: Resets this to an empty str.
         :type: str
-        """
-        return self._kernel_options_post
-
-    @kernel_options_post.setter
-    def kernel_options_post(self, value: str):
-        """
-        Setter for kernel_options_post
+        """,
+    )
 
-        :param value: The new str for the ``kernel_options_post``.
-        :raises TypeError: In case value is not of type str.
-        """
-        if isinstance(value, str):
-            self._kernel_options_post = value
-        else:
-            raise TypeError("The kernel_options_post should be a str.")
-
-    @kernel_options_post.deleter
-    def kernel_options_post(self):
-        """
-        Resets the kernel_options_post to an empty string instead of deleting the attribute.
-        """
-        self._kernel_options_post = ""
-
-    @property
-    def template_files(self) -> str:
+    template_files = _TypedProperty(
+        str,
         """
         Currently only used in ESXi. Needs more investigation what this is for.
 
@@ -497,32 +330,11 @@ class Osversion:
         :setter: Will set this if the validation succeeds, otherwise will raise an exception (TypeError).
         :deleter: Resets this to an empty str.
         :type: str
-        """
-        return self._template_files
+        """,
+    )
 
-    @template_files.setter
-    def template_files(self, value: str):
-        """
-        Setter for template_files.
-
-        :param value: The new str for the ``template_files``.
-        :raises TypeError: In case value is not of type str.
-        """
-        if isinstance(value, str):
-            # TODO validate file path
-            self._template_files = value
-        else:
-            raise TypeError("The template_files should be a str.")
-
-    @template_files.deleter
-    def template_files(self):
-        """
-        Resets the template_files to an empty string instead of deleting the attribute.
-        """
-        self._template_files = ""
-
-    @property
-    def boot_files(self) -> set:
+    boot_files = _TypedProperty(
+        set,
         """
         Unknown field currently. There for compatibility reasons for now. Used by xenserver
 
@@ -530,152 +342,118 @@ class Osversion:
         :setter: Will set this if the validation succeeds, otherwise will raise an exception (TypeError).
         :deleter: Resets this to an empty list.
         :type: set
+        """,
+    )
+
+    boot_loaders = _TypedProperty(
+        dict,
         """
-        return self._boot_files
+        Defines the supported well known boot loaders inside Cobbler.
+
+        :getter: The last successfully validated value of this field.
+        :setter: If validation is successful the value will be set, otherwise raises an exception (TypeError).
+        :deleter: Resets this property to an empty dict.
+        :type: dict
+        """,
+    )
 
-    @boot_files.setter
-    def boot_files(self, value: set):
+    def encode(self) -> dict:
         """
-        Setter for the ``boot_files``.
+        Encodes a single :class:`Osversion`. This means that the properties of an object is transferred into a JSON.
 
-        :param value: The new boot files which should be set.
-        :raises TypeError: In case value was not of type list.
+        :return: The dictionary with the data.
         """
-        if isinstance(value, set):
-            self._boot_files = value
-        elif isinstance(value, list):
-            self._boot_files = set(value)
-        else:
-            raise TypeError("The boot_files should be a list.")
+        result = {}
+        for slot, (name, _, _) in zip(_SLOTS, _FIELDS):
+            value = getattr(self, slot)
+            if isinstance(value, set):
+                # Convert non JSON convertable sets to convertable lists, default values are skipped.
+                if value:
+                    result[name] = list(value)
+            elif isinstance(value, (bool, int)):
+                result[name] = value
+            elif isinstance(value, (str, list, dict)):
+                if value:
+                    result[name] = value
+            else:
+                raise TypeError("Wrong type for a value which should be exported.")
+        return result
 
-    @boot_files.deleter
-    def boot_files(self):
+    def to_json_bytes(self) -> bytes:
         """
-        Resets the boot_files to an empty list instead of deleting the attribute.
+        Serialize this version as UTF-8 encoded JSON bytes. Uses orjson when it is installed (install the library
+        with the ``fast-json`` extra) and falls back to the standard library otherwise.
+
+        :return: The bytes with the encoded JSON document.
         """
-        self._boot_files = set()
+        if orjson is not None:
+            return orjson.dumps(self.encode())
+        return json.dumps(self.encode()).encode("utf-8")
 
-    @property
-    def boot_loaders(self) -> dict:
+    @classmethod
+    def from_json_bytes(cls, data: bytes) -> "Osversion":
         """
-        Defines the supported well known boot loaders inside Cobbler.
+        Build a version from UTF-8 encoded JSON bytes.
 
-        :getter: The last successfully validated value of this field.
-        :setter: If validation is successful the value will be set, otherwise raises an exception (TypeError).
-        :deleter: Resets this property to an empty dict.
-        :type: dict
+        :param data: The bytes with the encoded JSON document.
+        :return: The decoded version.
         """
-        return self._boot_loaders
+        version = cls()
+        version.decode(orjson.loads(data) if orjson is not None else json.loads(data))
+        return version
 
-    @boot_loaders.setter
-    def boot_loaders(self, value: dict):
+    @classmethod
+    def decode_many(cls, items: list) -> list:
         """
-        Setter for the ``boot_loaders``.
+        Decode a list of dictionaries into a list of versions in one pass.
 
-        :param value: The new boot loaders which should be set.
-        :raises TypeError: In case value was not of type dict.
+        :param items: The iterable with the dictionaries to decode.
+        :return: The list with the decoded versions.
         """
-        if isinstance(value, dict):
-            # TODO validate dict format
-            self._boot_loaders = value
-        else:
-            raise TypeError("The boot_loaders should be a dict.")
+        result = []
+        for item in items:
+            version = cls()
+            version.decode(item)
+            result.append(version)
+        return result
 
-    @boot_loaders.deleter
-    def boot_loaders(self):
+    @classmethod
+    def encode_many(cls, versions: list) -> list:
         """
-        Resets the boot_loaders to an empty dictionary instead of deleting the attribute.
+        Encode a list of versions into a list of dictionaries in one pass.
+
+        :param versions: The iterable with the versions to encode.
+        :return: The list with the encoded dictionaries.
         """
-        self._boot_loaders = {}
+        return [version.encode() for version in versions]
 
-    def encode(self) -> dict:
+    def decode(self, data: dict, trusted: bool = False):
         """
-        Encodes a single :class:`Osversion`. This means that the properties of an object is transferred into a JSON.
+        Decodes the received data. This means parsing each attribute from the JSON into the property of an object.
 
-        :return: The dictionary with the data.
+        :param data: The data to decode.
+        :param trusted: When ``True`` the per field type validation is skipped. Only pass this for data whose shape
+                        is already guaranteed, for example the direct output of ``json.loads`` on a known document.
         """
-        keys_with_defaults = []
-        result = {}
-        interim_result = {
-            "signatures": self.signatures,
-            "version_file": self.version_file,
-            "version_file_regex": self.version_file_regex,
-            "kernel_arch": self.kernel_arch,
-            "kernel_arch_regex": self.kernel_arch_regex,
-            "supported_arches": self.supported_arches,
-            "supported_repo_breeds": self.supported_repo_breeds,
-            "kernel_file": self.kernel_file,
-            "initrd_file": self.initrd_file,
-            "isolinux_ok": self.isolinux_ok,
-            "default_autoinstall": self.default_autoinstall,
-            "kernel_options": self.kernel_options,
-            "kernel_options_post": self.kernel_options_post,
-            "template_files": self._template_files,
-            "boot_files": self.boot_files,
-            "boot_loaders": self.boot_loaders,
-        }
-
-        for key in interim_result:
-            value = interim_result[key]
-
-            # Convert non JSON convertable sets to convertable lists
-            if isinstance(value, set):
-                interim_result[key] = list(value)
-
-            if isinstance(value, str):
-                if value == "":
-                    keys_with_defaults.append(key)
-            elif isinstance(value, (list, set, dict)):
-                if len(value) == 0:
-                    keys_with_defaults.append(key)
-            elif isinstance(value, (bool, int)):
-                continue
-            else:
-                raise TypeError("Wrong type for a value which should be exported.")
-        for key in interim_result:
-            if key in keys_with_defaults:
-                continue
-            else:
-                result[key] = interim_result[key]
-        return result
+        if trusted:
+            self._decode_unchecked(data)
+            return
+        for name, field_type, _ in self._FIELDS:
+            setattr(
+                self, name, utils.convert_none_to_default(data.get(name), field_type)
+            )
 
-    def decode(self, data: dict):
+    def _decode_unchecked(self, data: dict):
         """
-        Decodes the received data. This means parsing each attribute from the JSON into the property of an object.
+        Write the fields straight into the slots without validation. JSON lists for set valued fields are still
+        converted and missing keys still fall back to the defaults.
 
         :param data: The data to decode.
         """
-        self.signatures = utils.convert_none_to_default(data.get("signatures"), set)
-        self.version_file = utils.convert_none_to_default(data.get("version_file"), str)
-        self.version_file_regex = utils.convert_none_to_default(
-            data.get("version_file_regex"), str
-        )
-        self.kernel_arch = utils.convert_none_to_default(data.get("kernel_arch"), str)
-        self.kernel_arch_regex = utils.convert_none_to_default(
-            data.get("kernel_arch_regex"), str
-        )
-        self.supported_arches = utils.convert_none_to_default(
-            data.get("supported_arches"), set
-        )
-        self.supported_repo_breeds = utils.convert_none_to_default(
-            data.get("supported_repo_breeds"), set
-        )
-        self.kernel_file = utils.convert_none_to_default(data.get("kernel_file"), str)
-        self.initrd_file = utils.convert_none_to_default(data.get("initrd_file"), str)
-        self.isolinux_ok = utils.convert_none_to_default(data.get("isolinux_ok"), bool)
-        self.default_autoinstall = utils.convert_none_to_default(
-            data.get("default_autoinstall"), str
-        )
-        self.kernel_options = utils.convert_none_to_default(
-            data.get("kernel_options"), str
-        )
-        self.kernel_options_post = utils.convert_none_to_default(
-            data.get("kernel_options_post"), str
-        )
-        self.template_files = utils.convert_none_to_default(
-            data.get("template_files"), str
-        )
-        self.boot_files = utils.convert_none_to_default(data.get("boot_files"), set)
-        self.boot_loaders = utils.convert_none_to_default(
-            data.get("boot_loaders"), dict
-        )
+        for slot, (name, field_type, default_factory) in zip(_SLOTS, _FIELDS):
+            value = data.get(name)
+            if value is None:
+                value = default_factory()
+            elif field_type is set:
+                value = set(value)
+            object.__setattr__(self, slot, value)
@@ -39,6 +39,7 @@ setup(
         "test": ["coverage", "pytest"],
         "docs": ["sphinx_rtd_theme"],
         "changelog": ["towncrier>=22.8.0"],
+        "fast-json": ["orjson"],
     },
     entry_points={
         "console_scripts": [
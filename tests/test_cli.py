@@ -0,0 +1,120 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from libcobblersignatures import Signatures, cli
+from libcobblersignatures.models.osversion import Osversion
+
+
+def test_import_does_not_pull_in_questionary():
+    # Arrange
+    check = (
+        "import sys; import libcobblersignatures.cli;"
+        "sys.exit(1 if 'questionary' in sys.modules else 0)"
+    )
+
+    # Act
+    result = subprocess.run([sys.executable, "-c", check])
+
+    # Assert
+    assert result.returncode == 0
+
+
+def test_question_registry():
+    # Arrange & Act
+    question = cli._question("main_menu_questions")
+
+    # Assert
+    assert question is not None
+    assert question is cli._question("main_menu_questions")
+
+
+def test_question_registry_covers_all_factories():
+    # Arrange & Act & Assert
+    for name in cli._QUESTION_FACTORIES:
+        assert cli._question(name) is not None
+
+
+def test_update_choices():
+    # Arrange
+    question = [{"type": "select", "name": "test", "choices": [""]}]
+    values = ["suse", "redhat"]
+
+    # Act
+    cli.update_choices(question, values)
+    cli.update_choices(question, values)
+
+    # Assert
+    assert question[0]["choices"] == ["suse", "redhat", "Go Back"]
+    assert values == ["suse", "redhat"]
+
+
+def test_update_choices_wrong_type():
+    # Arrange
+    question = ["not a dict"]
+
+    # Act & Assert
+    with pytest.raises(TypeError):
+        cli.update_choices(question, [])
+
+
+def test_batch_mode_does_not_pull_in_questionary(tmp_path):
+    # Arrange
+    target = tmp_path / "out.json"
+    check = (
+        "import sys; from libcobblersignatures.cli import main;"
+        "main(['--add-breed', 'suse', '--export-file', %r]);"
+        "sys.exit(1 if 'questionary' in sys.modules else 0)" % str(target)
+    )
+
+    # Act
+    result = subprocess.run([sys.executable, "-c", check])
+
+    # Assert
+    assert result.returncode == 0
+    assert json.loads(target.read_text()) == {"breeds": {"suse": {}}}
+
+
+def test_batch_export_string(capsys, monkeypatch):
+    # Arrange
+    monkeypatch.setattr(cli, "_os_signatures", Signatures())
+
+    # Act
+    cli.main(["--add-breed", "suse", "--export-string"])
+
+    # Assert
+    assert json.loads(capsys.readouterr().out) == {"breeds": {"suse": {}}}
+
+
+def test_field_tables_cover_editable_fields():
+    # Arrange
+    version = Osversion()
+
+    # Act & Assert
+    assert not set(cli._SCALAR_FIELDS) & set(cli._SET_FIELD_PROMPTS)
+    for field in list(cli._SCALAR_FIELDS) + list(cli._SET_FIELD_PROMPTS):
+        assert hasattr(version, field)
+
+
+def test_import_does_not_build_signatures():
+    # Arrange
+    check = (
+        "import sys; import libcobblersignatures.cli as cli;"
+        "sys.exit(1 if cli._os_signatures is not None else 0)"
+    )
+
+    # Act
+    result = subprocess.run([sys.executable, "-c", check])
+
+    # Assert
+    assert result.returncode == 0
+
+
+def test_os_signatures_module_attribute():
+    # Arrange & Act
+    instance = cli.os_signatures
+
+    # Assert
+    assert instance is cli._signatures()
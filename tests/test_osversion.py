@@ -1,3 +1,5 @@
+import copy
+
 import pytest
 
 from libcobblersignatures.models.osversion import Osversion
@@ -480,3 +482,124 @@ def test_decode():
 
     # Assert
     assert version.version_file == "test"
+
+
+def test_decode_missing_keys():
+    # Arrange
+    version = Osversion()
+
+    # Act
+    version.decode({})
+
+    # Assert
+    assert version.kernel_file == ""
+    assert version == Osversion()
+
+
+def test_decode_many():
+    # Arrange
+    data = [{"version_file": "one"}, {"version_file": "two"}]
+
+    # Act
+    result = Osversion.decode_many(data)
+
+    # Assert
+    assert [version.version_file for version in result] == ["one", "two"]
+
+
+def test_encode_many():
+    # Arrange
+    version = Osversion()
+    version.version_file = "test"
+
+    # Act
+    result = Osversion.encode_many([version, Osversion()])
+
+    # Assert
+    assert result == [{"version_file": "test", "isolinux_ok": False}, {"isolinux_ok": False}]
+
+
+def test_isolinux_ok_rejects_truthy_int():
+    # Arrange
+    version = Osversion()
+
+    # Act & Assert
+    with pytest.raises(TypeError):
+        version.isolinux_ok = 1
+
+
+def test_json_bytes_roundtrip():
+    # Arrange
+    version = Osversion()
+    version.version_file = "test"
+
+    # Act
+    result = Osversion.from_json_bytes(version.to_json_bytes())
+
+    # Assert
+    assert result == version
+
+
+def test_osversion_inequality_template_files():
+    # Arrange
+    version = Osversion()
+    other = Osversion()
+
+    # Act
+    other.template_files = "test"
+
+    # Assert
+    assert version != other
+
+
+def test_copy():
+    # Arrange
+    version = Osversion()
+    version.signatures.add("test")
+
+    # Act
+    result = copy.copy(version)
+
+    # Assert
+    assert result == version
+    assert result.signatures is version.signatures
+
+
+def test_deepcopy():
+    # Arrange
+    version = Osversion()
+    version.signatures.add("test")
+
+    # Act
+    result = copy.deepcopy(version)
+
+    # Assert
+    assert result == version
+    assert result.signatures is not version.signatures
+
+
+def test_decode_trusted():
+    # Arrange
+    version = Osversion()
+    data = {"version_file": "test", "supported_arches": ["x86_64"]}
+
+    # Act
+    version.decode(data, trusted=True)
+
+    # Assert
+    assert version.version_file == "test"
+    assert version.supported_arches == {"x86_64"}
+
+
+def test_decode_trusted_equals_checked():
+    # Arrange
+    checked = Osversion()
+    trusted = Osversion()
+    data = {"signatures": ["test"], "isolinux_ok": True}
+
+    # Act
+    checked.decode(data)
+    trusted.decode(data, trusted=True)
+
+    # Assert
+    assert checked == trusted
@@ -1,3 +1,4 @@
+import io
 from json.decoder import JSONDecodeError
 import pytest
 
@@ -259,3 +260,141 @@ def test_get_breed_index_by_name_not_existent():
 
     # Assert
     assert result == -1
+
+
+def test_breed_names():
+    # Arrange
+    os_signatures = Signatures()
+    os_signatures.addosbreed("suse")
+    os_signatures.addosbreed("redhat")
+
+    # Act
+    result = os_signatures.breed_names
+
+    # Assert
+    assert result == ["suse", "redhat"]
+
+
+def test_breed_names_after_remove():
+    # Arrange
+    os_signatures = Signatures()
+    os_signatures.addosbreed("suse")
+    os_signatures.breed_names
+
+    # Act
+    os_signatures.removeosbreed(0)
+
+    # Assert
+    assert os_signatures.breed_names == []
+
+
+def test_renameosbreed():
+    # Arrange
+    os_signatures = Signatures()
+    os_signatures.addosbreed("suse")
+
+    # Act
+    os_signatures.renameosbreed(0, "redhat")
+
+    # Assert
+    assert os_signatures.breed_names == ["redhat"]
+
+
+def test_renameosbreed_outofbounds():
+    # Arrange
+    os_signatures = Signatures()
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        os_signatures.renameosbreed(0, "redhat")
+
+
+def test_import_and_build():
+    # Arrange
+    os_signatures = Signatures()
+
+    # Act
+    os_signatures.import_and_build(ImportTypes.STRING, '{"breeds": {"suse": {}}}')
+
+    # Assert
+    assert os_signatures.osbreeds == [OsBreed("suse")]
+
+
+def test_dump_json():
+    # Arrange
+    os_signatures = Signatures()
+    os_signatures.addosbreed("suse")
+    target = io.StringIO()
+
+    # Act
+    os_signatures.dump_json(target)
+
+    # Assert
+    assert target.getvalue() == '{"breeds": {"suse": {}}}'
+
+
+def test_get_breed_by_name():
+    # Arrange
+    os_signatures = Signatures()
+    os_signatures.addosbreed("suse")
+
+    # Act
+    result = os_signatures.get_breed_by_name("suse")
+
+    # Assert
+    assert result is os_signatures.osbreeds[0]
+
+
+def test_get_breed_by_name_not_existent():
+    # Arrange
+    os_signatures = Signatures()
+
+    # Act
+    result = os_signatures.get_breed_by_name("redhat")
+
+    # Assert
+    assert result is None
+
+
+def test_export_cache_invalidation():
+    # Arrange
+    os_signatures = Signatures()
+    os_signatures.addosbreed("suse")
+    first = os_signatures.exportsignatures(ExportTypes.STRING)
+
+    # Act
+    os_signatures.addosbreed("redhat")
+    second = os_signatures.exportsignatures(ExportTypes.STRING)
+
+    # Assert
+    assert first == '{"breeds": {"suse": {}}}'
+    assert second == '{"breeds": {"suse": {}, "redhat": {}}}'
+
+
+def test_mark_dirty():
+    # Arrange
+    os_signatures = Signatures()
+    os_signatures.addosbreed("suse")
+    os_signatures.addosversion(0, "sles", None)
+    os_signatures.exportsignatures(ExportTypes.STRING)
+
+    # Act
+    os_signatures.osbreeds[0].osversions["sles"].version_file = "test"
+    os_signatures.mark_dirty()
+    result = os_signatures.exportsignatures(ExportTypes.STRING)
+
+    # Assert
+    assert "test" in result
+
+
+def test_get_breed_by_name_after_rename():
+    # Arrange
+    signatures = Signatures()
+    signatures.addosbreed("suse")
+
+    # Act
+    signatures.renameosbreed(0, "redhat")
+
+    # Assert
+    assert signatures.get_breed_by_name("suse") is None
+    assert signatures.get_breed_by_name("redhat") is signatures.osbreeds[0]